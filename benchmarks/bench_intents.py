@@ -0,0 +1,49 @@
+"""Бенчмарк разбора правок: сообщений в секунду на корпусе benchmarks/intent_corpus.
+
+Печатает скорость определения намерения (match_intent), полного apply_change
+и, для сравнения, прежнего безусловного search_dates на каждое сообщение.
+
+    python -m benchmarks.bench_intents --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List, Optional
+
+from dateparser.search import search_dates
+
+from benchmarks.intent_corpus import CORPUS, fresh_project
+from src import nlp
+
+MESSAGES = [case.text for case in CORPUS]
+
+
+def _rate(label: str, func: Callable[[str], object], rounds: int) -> None:
+    func(MESSAGES[0])  # прогрев
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in MESSAGES:
+            func(text)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {rounds * len(MESSAGES) / elapsed:10.0f} сообщений/с")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(f"Корпус: {len(MESSAGES)} сообщений, проходов: {args.rounds}")
+    _rate("match_intent", nlp.match_intent, args.rounds * 100)
+    _rate("apply_change", lambda text: nlp.apply_change(fresh_project(), text), args.rounds)
+    _rate(
+        "search_dates на каждое (прежде)",
+        lambda text: search_dates(text, languages=["ru"], settings=nlp.DATE_SETTINGS),
+        args.rounds,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Микробенчмарк ответа: карточка проекта и клавиатуры до и после кэширования.
+
+«До» — прямой рендер карточки и новая ReplyKeyboardMarkup на каждый ответ,
+«после» — rendering.project_card и закэшированные клавиатуры.
+
+    python -m benchmarks.bench_rendering --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from src import keyboards, rendering
+
+PROJECT: Dict[str, Any] = {
+    "event_id": "bench",
+    "revision": 3,
+    "title": "Конференция «Digital Day»",
+    "date": "2026-11-25",
+    "time": "10:00",
+    "place": "лофт на Бауманской",
+    "audience": "партнёров",
+    "budget": 500000,
+    "sections": {
+        "дедлайны": {
+            "notes": [],
+            "entries": [
+                {"due_date": f"2026-11-{day:02d}", "context": f"{day}.11"} for day in range(1, 20)
+            ],
+        },
+    },
+}
+
+
+def reply_before() -> None:
+    rendering._render_project_card(PROJECT)
+    keyboards.main_menu_keyboard.__wrapped__()
+    keyboards.confirmation_keyboard.__wrapped__(include_back=True)
+
+
+def reply_after() -> None:
+    rendering.project_card(PROJECT)
+    keyboards.main_menu_keyboard()
+    keyboards.confirmation_keyboard(include_back=True)
+
+
+def _measure_allocations(func: Callable[[], None]) -> float:
+    """Байты, выделенные за один ответ (по пику tracemalloc)."""
+    func()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return float(peak)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    for label, func in (("до", reply_before), ("после", reply_after)):
+        latency = min(timeit.repeat(func, number=args.number, repeat=3)) / args.number
+        print(
+            f"{label:>5}: {latency * 1_000_000:7.2f} мкс/ответ, "
+            f"{_measure_allocations(func):8.0f} байт выделено за ответ"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Корпус сообщений для разбора правок: текст → намерение и результат.
+
+Используется тестами (tests/test_intents.py) и бенчмарком
+(benchmarks/bench_intents.py). Даты дедлайнов указаны как ММ-ДД, чтобы не
+зависеть от текущего года.
+"""
+
+import copy
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class IntentCase(NamedTuple):
+    text: str
+    intent: Optional[str]
+    expected: Dict[str, Any]
+
+
+BASE_PROJECT: Dict[str, Any] = {
+    "event_id": "corpus",
+    "title": "Форум",
+    "sections": {
+        "подрядчики": {"notes": [], "entries": [{"name": "типография «Иванов»"}]},
+        "дедлайны": {
+            "notes": [],
+            "entries": [
+                {
+                    "due_date": "2026-11-25",
+                    "context": "25.11",
+                    "description": "согласовать смету до 25.11",
+                },
+                {
+                    "due_date": "2026-11-03",
+                    "context": "03.11",
+                    "description": "монтаж сцены до 03.11",
+                },
+            ],
+        },
+    },
+}
+
+CORPUS = [
+    IntentCase(
+        "измени тайминг выхода ведущего на 21:00",
+        "host_time",
+        {"requires_confirmation": True, "new_deadlines": []},
+    ),
+    IntentCase(
+        "добавь подрядчика: типография «Петров», срок 25.11",
+        "add_contractor",
+        {"contractors": 2, "new_deadlines": ["11-25"]},
+    ),
+    IntentCase("удали подрядчика Иванов", "remove_contractor", {"contractors": 0}),
+    IntentCase("убери подрядчика Сидоров", "remove_contractor", {"contractors": 1, "updated": False}),
+    IntentCase("перенеси дедлайн по смете на 1 декабря", "move_deadline", {"first_deadline": "12-01"}),
+    IntentCase("перенеси дедлайн 25.11 на 30.11", "move_deadline", {"first_deadline": "11-30"}),
+    IntentCase(
+        "перенеси дедлайн по рассадке на 1 декабря",
+        "move_deadline",
+        {"first_deadline": "11-25", "updated": False},
+    ),
+    IntentCase(
+        "перенеси срок на монтаж на 5 ноября",
+        "move_deadline",
+        {"first_deadline": "11-25", "second_deadline": "11-05"},
+    ),
+    IntentCase("смени площадку на Лофт Арт", "venue", {"place": "Лофт Арт"}),
+    # Точка в адресе не обрезает место, а дата уходит в дедлайны, не в адрес
+    IntentCase("смени площадку на ул. Ленина 5", "venue", {"place": "ул. Ленина 5", "new_deadlines": []}),
+    IntentCase(
+        "смени площадку на Лофт Арт 25.11",
+        "venue",
+        {"place": "Лофт Арт", "new_deadlines": ["11-25"]},
+    ),
+    IntentCase("Новая площадка: Белый зал", "venue", {"place": "Белый зал"}),
+    IntentCase("бюджет 1,5 млн", "budget", {"budget": 1_500_000, "new_deadlines": []}),
+    IntentCase(
+        "бюджет: 500 000 руб, оплата до 25.11",
+        "budget",
+        {"budget": 500_000, "new_deadlines": ["11-25"]},
+    ),
+    IntentCase("будет 120 гостей", "guests", {"guests": 120}),
+    IntentCase("гостей: 80", "guests", {"guests": 80}),
+    IntentCase("на 100 гостей, сбор 20.12", "guests", {"guests": 100, "new_deadlines": ["12-20"]}),
+    # Числа из дат не должны становиться бюджетом или количеством гостей
+    IntentCase(
+        "согласовать бюджет до 25.11",
+        "deadlines",
+        {"budget": None, "new_deadlines": ["11-25"]},
+    ),
+    IntentCase(
+        "напомнить гостям до 5 ноября",
+        "deadlines",
+        {"guests": None, "new_deadlines": ["11-05"]},
+    ),
+    IntentCase(
+        "бригада 5 человек приедет 12.11",
+        "deadlines",
+        {"guests": None, "new_deadlines": ["11-12"]},
+    ),
+    IntentCase("сдать макеты 01.12.2026", "deadlines", {"new_deadlines": ["12-01"]}),
+    # Десятичное число с единицей измерения — не дата
+    IntentCase("счёт на 2.5 тыс до 1 декабря", "deadlines", {"new_deadlines": ["12-01"]}),
+    IntentCase("доставка 3.5 тонн 1 декабря", "deadlines", {"new_deadlines": ["12-01"]}),
+    IntentCase("встреча в пятницу", "deadlines", {"updated": True}),
+    IntentCase("просто заметка", None, {"updated": False, "new_deadlines": []}),
+    IntentCase("позвонить менеджеру площадки", None, {"updated": False, "place": None}),
+]
+
+
+def fresh_project() -> Dict[str, Any]:
+    return copy.deepcopy(BASE_PROJECT)
+
+
+def observe(project: Dict[str, Any], response: Dict[str, Any]) -> Dict[str, Any]:
+    """Сводка результата в терминах поля `expected` корпуса."""
+    deadlines = project["sections"]["дедлайны"]["entries"]
+    return {
+        "updated": response["updated"],
+        "requires_confirmation": response["requires_confirmation"],
+        "budget": project.get("budget"),
+        "guests": project.get("guests"),
+        "place": project.get("place"),
+        "contractors": len(project["sections"]["подрядчики"]["entries"]),
+        "first_deadline": deadlines[0]["due_date"][5:],
+        "second_deadline": deadlines[1]["due_date"][5:],
+        "new_deadlines": [entry["due_date"][5:] for entry in deadlines[2:]],
+    }
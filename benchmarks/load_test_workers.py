@@ -0,0 +1,143 @@
+"""Нагрузочный тест многопроцессного режима.
+
+Синтетические обновления Telegram проходят тот же путь, что и в боте: фронт
+раздаёт их через WorkerPool.dispatch (маршрутизация, Update.to_dict, очередь),
+воркер восстанавливает Update.de_json и передаёт приложению. Вместо
+PTB-приложения воркер поднимает LoadTestApplication: она разбирает текст
+nlp.parse_freeform и сохраняет проект чата через storage с проверкой ревизии.
+Скрипт печатает пропускную способность для разного числа процессов.
+
+    python -m benchmarks.load_test_workers --messages 400 --chats 64 --workers 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import os
+import tempfile
+import time
+from multiprocessing.queues import Queue
+from pathlib import Path
+from typing import List, Optional
+
+from telegram import Update
+
+from src import nlp, storage, workers
+
+MESSAGES = [
+    "Конференция «Digital Day» 25 ноября в 10:00 в лофте на Бауманской для партнёров",
+    "Корпоратив 20 декабря, кейтеринг и фуршет, ведущий и артисты, бюджет 500 тыс",
+    "Презентация продукта в пятницу в 18:30, свет и звук, фото и видео",
+]
+
+
+def _handle(chat_id: int, text: str) -> None:
+    parsed = nlp.parse_freeform(text)
+    event_id = f"chat{abs(chat_id)}"
+    while True:
+        project = storage.load_project(event_id)
+        if project is None:
+            parsed["event_id"] = event_id
+            storage.save_project(parsed)
+            return
+        project["notes"] = parsed["notes"]
+        project["sections"] = parsed["sections"]
+        try:
+            storage.update_project(project)
+            return
+        except storage.RevisionConflict:
+            continue
+
+
+class LoadTestApplication:
+    """Подменяет PTB Application в воркере: без сети, только разбор и storage."""
+
+    bot = None
+
+    def __init__(self, data_dir: str, ready: Queue, token: str) -> None:
+        self._data_dir = data_dir
+        self._ready = ready
+
+    async def initialize(self) -> None:
+        storage.set_data_dir(Path(self._data_dir))
+        storage.ensure_storage()
+        nlp.parse_freeform(MESSAGES[0])  # прогрев dateparser
+
+    async def start(self) -> None:
+        self._ready.put(os.getpid())
+
+    async def process_update(self, update: Update) -> None:
+        _handle(update.effective_chat.id, update.effective_message.text)
+
+    async def stop(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+
+def _update(number: int, chat_id: int, text: str) -> Update:
+    data = {
+        "update_id": number,
+        "message": {
+            "message_id": number,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "text": text,
+        },
+    }
+    return Update.de_json(data, None)
+
+
+async def _send(pool: workers.WorkerPool, updates: List[Update]) -> None:
+    for update in updates:
+        await pool.dispatch(update)
+
+
+def run_once(worker_count: int, messages: int, chats: int) -> float:
+    """Возвращает сообщений в секунду для заданного числа процессов."""
+    with tempfile.TemporaryDirectory() as data_dir:
+        ready = multiprocessing.get_context("spawn").Queue()
+        factory = functools.partial(LoadTestApplication, data_dir, ready)
+        pool = workers.WorkerPool("load-test", worker_count, factory)
+        updates = [
+            _update(number, 1000 + number % chats, MESSAGES[number % len(MESSAGES)])
+            for number in range(messages)
+        ]
+        pool.start()
+        for _ in range(worker_count):
+            ready.get()
+
+        started = time.perf_counter()
+        asyncio.run(_send(pool, updates))
+        pool.stop(join_timeout=None)
+        return messages / (time.perf_counter() - started)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=400)
+    parser.add_argument("--chats", type=int, default=64)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+    )
+    args = parser.parse_args(argv)
+
+    baseline: Optional[float] = None
+    for worker_count in args.workers:
+        rate = run_once(worker_count, args.messages, args.chats)
+        baseline = baseline or rate
+        print(
+            f"воркеров: {worker_count:>2}  {rate:8.1f} сообщений/с  "
+            f"ускорение x{rate / baseline:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Потоковая выгрузка проектов в CSV и JSONL."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import IO, Any, Dict, Iterable, Iterator
+
+FORMATS = ("csv", "jsonl")
+
+EXPORT_FIELDS = [
+    "event_id",
+    "title",
+    "date",
+    "time",
+    "place",
+    "audience",
+    "budget",
+    "guests",
+    "record",
+    "section",
+    "key",
+    "value",
+    "due_date",
+    "timestamp",
+]
+
+PROJECT_FIELDS = ("event_id", "title", "date", "time", "place", "audience", "budget", "guests")
+
+
+def _flatten_fields(prefix: str, data: Dict[str, Any]) -> Iterator[tuple[str, Any]]:
+    """Разворачивает вложенные поля секции в пары «путь — значение»."""
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from _flatten_fields(path, value)
+        else:
+            yield path, value
+
+
+def iter_project_records(project: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Превращает проект в плоские записи: сам проект, заметки, дедлайны, подрядчики."""
+    base = {field: project.get(field) for field in PROJECT_FIELDS}
+    yield {**base, "record": "project", "value": project.get("notes"), "timestamp": project.get("created_at")}
+
+    for section_name, section in (project.get("sections") or {}).items():
+        if not isinstance(section, dict):
+            continue
+        for note in section.get("notes") or []:
+            yield {**base, "record": "note", "section": section_name, "value": note}
+        for entry in section.get("entries") or []:
+            if section_name == "дедлайны":
+                yield {
+                    **base,
+                    "record": "deadline",
+                    "section": section_name,
+                    "value": entry.get("context"),
+                    "due_date": entry.get("due_date"),
+                    "timestamp": entry.get("captured_at"),
+                }
+            elif section_name == "подрядчики":
+                yield {
+                    **base,
+                    "record": "contractor",
+                    "section": section_name,
+                    "value": entry.get("name"),
+                    "timestamp": entry.get("added_at"),
+                }
+        extra = {key: value for key, value in section.items() if key not in {"notes", "entries"}}
+        for key, value in _flatten_fields("", extra):
+            yield {**base, "record": "field", "section": section_name, "key": key, "value": value}
+
+
+def iter_records(projects: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Поток плоских записей по всем проектам."""
+    for project in projects:
+        yield from iter_project_records(project)
+
+
+def write_export(records: Iterable[Dict[str, Any]], fmt: str, buffer: IO[bytes]) -> int:
+    """Записывает записи в бинарный буфер построчно и возвращает их количество."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат выгрузки: {fmt}")
+    # utf-8-sig, чтобы Excel корректно открыл кириллицу в CSV
+    encoding = "utf-8-sig" if fmt == "csv" else "utf-8"
+    stream = io.TextIOWrapper(buffer, encoding=encoding, newline="")
+    count = 0
+    try:
+        if fmt == "csv":
+            writer = csv.DictWriter(stream, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                count += 1
+        else:
+            for record in records:
+                stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+    finally:
+        stream.flush()
+        stream.detach()
+    return count
@@ -1,5 +1,5 @@
 """Пакет с обработчиками бота."""
 
-from . import new_event, projects, settings, start, stats
+from . import admin, export, new_event, projects, settings, start, stats
 
-__all__ = ["new_event", "projects", "settings", "start", "stats"]
+__all__ = ["admin", "export", "new_event", "projects", "settings", "start", "stats"]
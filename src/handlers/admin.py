@@ -0,0 +1,74 @@
+"""Служебные команды для администраторов бота."""
+
+import os
+from typing import Optional, Set
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from src import profiling
+
+PROFILE_USAGE = (
+    "Использование: /profile N [state=<состояние>] [chat=<id чата>] или /profile stop"
+)
+
+
+def admin_ids() -> Set[int]:
+    """Идентификаторы администраторов из переменной окружения ADMIN_IDS."""
+    ids: Set[int] = set()
+    for raw in os.getenv("ADMIN_IDS", "").split(","):
+        raw = raw.strip()
+        if raw.lstrip("-").isdigit():
+            ids.add(int(raw))
+    return ids
+
+
+def is_admin(update: Update) -> bool:
+    """Проверяет, что сообщение пришло от администратора."""
+    return bool(update.effective_user) and update.effective_user.id in admin_ids()
+
+
+async def profile(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Включает профилирование следующих N сообщений или останавливает его."""
+    if not is_admin(update):
+        await update.message.reply_text("Команда доступна только администраторам.")
+        return
+
+    args = context.args or []
+    if args and args[0].lower() == "stop":
+        result = profiling.stop()
+        if result is None:
+            await update.message.reply_text("Профилирование не запущено.")
+            return
+        await profiling.send_report(context, result)
+        return
+
+    if not args or not args[0].isdigit():
+        await update.message.reply_text(PROFILE_USAGE)
+        return
+
+    state: Optional[str] = None
+    chat_id: Optional[int] = None
+    for arg in args[1:]:
+        key, _, value = arg.partition("=")
+        if key == "state" and value:
+            state = value
+        elif key == "chat" and value.lstrip("-").isdigit():
+            chat_id = int(value)
+        else:
+            await update.message.reply_text(PROFILE_USAGE)
+            return
+
+    try:
+        profiling.start(
+            int(args[0]),
+            report_chat_id=update.effective_chat.id,
+            state=state,
+            chat_id=chat_id,
+        )
+    except (RuntimeError, ValueError) as err:
+        await update.message.reply_text(str(err))
+        return
+    await update.message.reply_text(
+        f"Профилирую следующие {args[0]} сообщений. Отчёт пришлю документом."
+    )
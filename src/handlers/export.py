@@ -0,0 +1,70 @@
+"""Выгрузка проектов документом."""
+
+import asyncio
+import gzip
+import shutil
+import tempfile
+from typing import IO
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from src import export, keyboards, storage
+from src.handlers.admin import is_admin
+
+# До этого размера выгрузка держится в памяти, дальше уходит во временный файл на диске
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+# Лимит Telegram на документ от бота — 50 МБ; оставляем запас на multipart-обёртку.
+# PTB читает отправляемый файл в память целиком, так что это же и потолок по памяти.
+MAX_UPLOAD_SIZE = 49 * 1024 * 1024
+
+
+def _gzip_to(source: IO[bytes], target: IO[bytes]) -> None:
+    """Потоково сжимает выгрузку, не поднимая её в память целиком."""
+    source.seek(0)
+    with gzip.GzipFile(fileobj=target, mode="wb") as compressed:
+        shutil.copyfileobj(source, compressed)
+
+
+async def export_projects(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Отправляет все проекты файлом: /export csv или /export jsonl."""
+    if not is_admin(update):
+        await update.message.reply_text("Команда доступна только администраторам.")
+        return
+
+    fmt = context.args[0].lower() if context.args else "csv"
+    if fmt not in export.FORMATS:
+        await update.message.reply_text(
+            "Формат выгрузки: /export csv или /export jsonl.",
+            reply_markup=keyboards.main_menu_keyboard(),
+        )
+        return
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+        count = await asyncio.to_thread(
+            export.write_export,
+            export.iter_records(storage.iter_projects()),
+            fmt,
+            buffer,
+        )
+        filename = f"eventpilot_projects.{fmt}"
+        document: IO[bytes] = buffer
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as compressed:
+            if buffer.tell() > MAX_UPLOAD_SIZE:
+                await asyncio.to_thread(_gzip_to, buffer, compressed)
+                document, filename = compressed, f"{filename}.gz"
+            if document.tell() > MAX_UPLOAD_SIZE:
+                await update.message.reply_text(
+                    f"Выгрузка слишком большая даже в gzip ({document.tell() // (1024 * 1024)} МБ), "
+                    "а Telegram принимает от бота файлы до 50 МБ. "
+                    "Попробуйте /export jsonl или выгрузите данные с сервера напрямую.",
+                    reply_markup=keyboards.main_menu_keyboard(),
+                )
+                return
+            document.seek(0)
+            await update.message.reply_document(
+                document=document,
+                filename=filename,
+                caption=f"Выгрузка проектов: {count} строк.",
+                reply_markup=keyboards.main_menu_keyboard(),
+            )
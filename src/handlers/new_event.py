@@ -3,7 +3,7 @@
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from src import keyboards, nlp, storage
+from src import keyboards, nlp, rendering, storage
 from src.states import STATE_NEW_EVENT_DESCRIPTION
 
 PROMPT_TEXT = (
@@ -25,14 +25,5 @@ async def handle_description(update: Update, context: ContextTypes.DEFAULT_TYPE)
     storage.save_project(project)
     context.user_data.clear()
 
-    sections = project.get("sections", {})
-    section_names = ", ".join(name for name, data in sections.items() if data.get("notes"))
-    if not section_names:
-        section_names = ", ".join(sections.keys())
-    summary = (
-        f"Создано: {project.get('title')} — "
-        f"{project.get('date') or 'дата не указана'} "
-        f"{project.get('time') or ''} — {project.get('place') or 'место не указано'}.\n"
-        f"Папки: {section_names}."
-    )
+    summary = rendering.created_summary(project)
     await update.message.reply_text(summary, reply_markup=keyboards.main_menu_keyboard())
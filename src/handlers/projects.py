@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import asyncio
+import logging
+import random
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from src import keyboards, nlp, storage
+from src import keyboards, nlp, rendering, storage
 from src.states import (
     STATE_PROJECT_CONFIRM,
     STATE_PROJECT_EDIT,
     STATE_PROJECT_SELECT,
 )
 
+LOGGER = logging.getLogger(__name__)
+
+MAX_SAVE_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.05
+CONFLICT_REPLY = "Проект сейчас активно редактируют коллеги. Повторите изменение через пару секунд."
+
+Mutation = Callable[[Dict[str, Any]], Tuple[Any, bool]]
+
 
 async def show_projects(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Показывает последние проекты."""
@@ -43,19 +54,35 @@ async def show_projects(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     )
 
 
-def _format_project_summary(project: Dict[str, any]) -> str:
-    sections = project.get("sections", {})
-    deadlines = sections.get("дедлайны", {}).get("entries", [])
-    deadlines_text = "\n".join(
-        f"— {item.get('due_date')} — {item.get('context')}" for item in deadlines[:3]
-    )
-    return (
-        f"Проект: {project.get('title')}\n"
-        f"Дата: {project.get('date') or 'не указана'} {project.get('time') or ''}\n"
-        f"Место: {project.get('place') or 'не указано'}\n"
-        f"Аудитория: {project.get('audience') or 'не указана'}\n"
-        f"Дедлайны:\n{deadlines_text or 'пока нет'}"
-    )
+def _load_apply_save(project_id: str, mutate: Mutation) -> Optional[Tuple[Dict[str, Any], Any]]:
+    """Один оптимистичный проход: загрузка, изменение и сохранение по ревизии."""
+    project = storage.load_project(project_id)
+    if not project:
+        return None
+    result, needs_save = mutate(project)
+    if needs_save:
+        storage.update_project(project)
+    return project, result
+
+
+async def _edit_project(project_id: str, mutate: Mutation) -> Optional[Tuple[Dict[str, Any], Any]]:
+    """Применяет изменение к свежей версии проекта, повторяя его при конфликте.
+
+    Внутри одного процесса загрузка, изменение и запись идут без await, поэтому
+    конфликт возможен только с другим процессом (многопроцессный режим).
+    asyncio-блокировка от него не защищает, так что между попытками просто
+    ждём со случайной экспоненциальной задержкой, чтобы разойтись с соперником.
+    """
+    for attempt in range(1, MAX_SAVE_ATTEMPTS + 1):
+        try:
+            return _load_apply_save(project_id, mutate)
+        except storage.RevisionConflict as err:
+            if attempt == MAX_SAVE_ATTEMPTS:
+                raise
+            delay = random.uniform(0, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+            LOGGER.info("%s, повтор через %.3f с", err, delay)
+            await asyncio.sleep(delay)
+    return None
 
 
 async def select_project(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -77,7 +104,7 @@ async def select_project(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     context.user_data["state"] = STATE_PROJECT_EDIT
     context.user_data["current_project_id"] = project_id
     await update.message.reply_text(
-        _format_project_summary(project)
+        rendering.project_card(project)
         + "\n\nДобавить/изменить: напишите свободным текстом, например: “добавь подрядчика: типография «Иванов», срок 25.11” или “измени тайминг выхода ведущего на 21:00”.",
         reply_markup=keyboards.confirmation_keyboard(include_back=True),
     )
@@ -90,12 +117,22 @@ async def process_edit(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         await update.message.reply_text("Сначала выберите проект.", reply_markup=keyboards.main_menu_keyboard())
         return
 
-    project = storage.load_project(project_id)
-    if not project:
+    user_text = update.message.text or ""
+
+    def mutate(project: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        result = nlp.apply_change(project, user_text)
+        return result, not result.get("requires_confirmation")
+
+    try:
+        edited = await _edit_project(project_id, mutate)
+    except storage.RevisionConflict:
+        await update.message.reply_text(CONFLICT_REPLY)
+        return
+    if not edited:
         await update.message.reply_text("Не удалось загрузить проект.")
         return
 
-    result = nlp.apply_change(project, update.message.text or "")
+    _, result = edited
     if result.get("requires_confirmation"):
         context.user_data["state"] = STATE_PROJECT_CONFIRM
         context.user_data["pending_change"] = result.get("pending_change")
@@ -105,14 +142,12 @@ async def process_edit(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         return
 
     if result.get("updated"):
-        storage.update_project(project)
         await update.message.reply_text(
             f"Готово: обновил {result.get('summary') or 'проект'}.",
             reply_markup=keyboards.confirmation_keyboard(include_back=True),
         )
         return
 
-    storage.update_project(project)
     await update.message.reply_text(
         result["reply"], reply_markup=keyboards.confirmation_keyboard(include_back=True)
     )
@@ -132,12 +167,18 @@ async def confirm_change(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     answer = (update.message.text or "").strip()
     if answer == "✅ Да":
-        project = storage.load_project(project_id)
-        if not project:
+        try:
+            edited = await _edit_project(
+                project_id,
+                lambda project: (nlp.apply_confirmed_change(project, pending_change), True),
+            )
+        except storage.RevisionConflict:
+            await update.message.reply_text(CONFLICT_REPLY)
+            return
+        if not edited:
             await update.message.reply_text("Не удалось загрузить проект.")
             return
-        description = nlp.apply_confirmed_change(project, pending_change)
-        storage.update_project(project)
+        _, description = edited
         context.user_data["state"] = STATE_PROJECT_EDIT
         context.user_data.pop("pending_change", None)
         await update.message.reply_text(
@@ -1,5 +1,7 @@
 """Определения клавиатур для бота."""
 
+from functools import lru_cache
+
 from telegram import ReplyKeyboardMarkup
 
 MAIN_MENU_BUTTONS = [
@@ -11,16 +13,17 @@ CONFIRMATION_BUTTONS = [["✅ Да", "⛔️ Отмена"]]
 BACK_TO_MENU = [["🔙 Главное меню"]]
 
 
+# Разметка клавиатур неизменяема, поэтому постоянные клавиатуры строятся один раз
+@lru_cache(maxsize=None)
 def main_menu_keyboard() -> ReplyKeyboardMarkup:
     """Главное меню бота."""
     return ReplyKeyboardMarkup(MAIN_MENU_BUTTONS, resize_keyboard=True)
 
 
+@lru_cache(maxsize=None)
 def confirmation_keyboard(include_back: bool = True) -> ReplyKeyboardMarkup:
     """Клавиатура подтверждения действий."""
-    buttons = CONFIRMATION_BUTTONS.copy()
-    if include_back:
-        buttons = buttons + BACK_TO_MENU
+    buttons = CONFIRMATION_BUTTONS + BACK_TO_MENU if include_back else CONFIRMATION_BUTTONS
     return ReplyKeyboardMarkup(buttons, resize_keyboard=True, one_time_keyboard=True)
 
 
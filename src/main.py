@@ -17,7 +17,8 @@ from telegram.ext import (
     filters,
 )
 
-from src.handlers import new_event, projects, settings, start, stats
+from src import profiling, workers
+from src.handlers import admin, export, new_event, projects, settings, start, stats
 from src.states import (
     STATE_NEW_EVENT_DESCRIPTION,
     STATE_PROJECT_CONFIRM,
@@ -92,7 +93,11 @@ def build_application(token: str) -> Application:
         .build()
     )
     application.add_handler(CommandHandler("start", start.start))
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text))
+    application.add_handler(CommandHandler("export", export.export_projects))
+    application.add_handler(CommandHandler("profile", admin.profile))
+    text_handler = MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text)
+    profiling.install(text_handler)
+    application.add_handler(text_handler)
     return application
 
 
@@ -103,6 +108,11 @@ async def main() -> None:
     if not token:
         raise RuntimeError("Не найден TELEGRAM_TOKEN в окружении. Заполните .env файл.")
 
+    worker_count = int(os.getenv("WORKERS") or 1)
+    if worker_count > 1:
+        await workers.run(token, worker_count, build_application)
+        return
+
     application = build_application(token)
     LOGGER.info("Запускаем EventPilot")
     await application.initialize()
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import re
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, FrozenSet, List, Match, Optional, Pattern, Set, Tuple
 
 from dateparser import parse
 from dateparser.search import search_dates
+from rapidfuzz import fuzz, process
 
 SECTION_NAMES = [
     "подрядчики",
@@ -150,86 +152,445 @@ def apply_confirmed_change(project: Dict[str, Any], change: Dict[str, Any]) -> s
     return description
 
 
-def apply_change(project: Dict[str, Any], user_text: str) -> Dict[str, Any]:
-    """Пытается применить изменение к проекту."""
-    lower_text = user_text.lower()
-    sections = project.setdefault("sections", {})
-    response: Dict[str, Any] = {
-        "reply": "Не нашёл конкретного действия, добавил заметку в историю.",
-        "updated": False,
-        "requires_confirmation": False,
-        "pending_change": None,
-        "summary": None,
-    }
+IntentHandler = Callable[[Dict[str, Any], str, Dict[str, Any]], None]
 
-    # Изменение времени ведущего
-    if ("измени" in lower_text or "поменяй" in lower_text) and "ведущ" in lower_text:
-        time_match = TIME_PATTERN.search(user_text)
-        if time_match:
-            new_time = time_match.group(1)
-            program_section = sections.setdefault("программа/сценарий", {"notes": []})
-            host_info = program_section.get("ведущий", {})
-            old_time = host_info.get("time")
-            response.update(
-                {
-                    "reply": (
-                        f"Поменять время ведущего с {old_time or 'не задано'} на {new_time}?\n"
-                        "Ответьте: ✅ Да или ⛔️ Отмена"
-                    ),
-                    "requires_confirmation": True,
-                    "pending_change": {
-                        "section": "программа/сценарий",
-                        "path": ["ведущий", "time"],
-                        "value": new_time,
-                        "summary": f"время ведущего на {new_time}",
-                        "old": old_time,
-                    },
-                }
-            )
-            return response
 
-    # Добавление подрядчика
-    if "добав" in lower_text and "подрядчик" in lower_text:
-        contractor_info = user_text.split("подрядчик", 1)[-1].strip(" :.-") or "без названия"
-        contractors_section = sections.setdefault("подрядчики", {"notes": []})
-        entries: List[Dict[str, Any]] = contractors_section.setdefault("entries", [])
-        entry = {
-            "name": contractor_info,
-            "added_at": datetime.utcnow().isoformat(),
-        }
-        entries.append(entry)
-        response.update(
-            {
-                "reply": f"Готово: добавил подрядчика {contractor_info}.",
-                "updated": True,
-                "summary": f"подрядчик {contractor_info}",
-            }
+@dataclass(frozen=True)
+class Intent:
+    """Намерение пользователя при редактировании проекта.
+
+    `keywords` — основы слов, без которых намерение невозможно. Ключевые слова
+    всех намерений собраны в один регэксп KEYWORD_MATCHER: один проход по
+    тексту даёт кандидатов, и только их `pattern` проверяется целиком.
+    Среди подтверждённых кандидатов выигрывает зарегистрированный раньше.
+    """
+
+    name: str
+    keywords: Tuple[str, ...]
+    pattern: Pattern[str]
+    handler: IntentHandler
+    captures_deadlines: bool = False
+    # Фрагменты, которые нельзя отдавать поиску дат (суммы, количество гостей)
+    not_dates: Optional[Pattern[str]] = None
+
+
+_INTENTS: List[Intent] = []
+
+
+def intent(
+    name: str,
+    keywords: Tuple[str, ...],
+    pattern: str,
+    captures_deadlines: bool = False,
+    not_dates: Optional[Pattern[str]] = None,
+) -> Callable[[IntentHandler], IntentHandler]:
+    """Регистрирует обработчик намерения. Вызывается до сборки KEYWORD_MATCHER."""
+
+    def decorator(handler: IntentHandler) -> IntentHandler:
+        _INTENTS.append(
+            Intent(
+                name,
+                keywords,
+                re.compile(pattern, re.IGNORECASE | re.DOTALL),
+                handler,
+                captures_deadlines,
+                not_dates,
+            )
         )
+        return handler
 
-    # Любые даты и дедлайны
-    deadlines = sections.setdefault("дедлайны", {"notes": []})
+    return decorator
+
+
+def _compile_keywords(intents: List[Intent]) -> Tuple[Pattern[str], Dict[str, FrozenSet[str]]]:
+    """Собирает ключевые слова в один регэксп и таблицу «группа → намерения»."""
+    owners: Dict[str, Set[str]] = {}
+    for item in intents:
+        for keyword in item.keywords:
+            owners.setdefault(keyword, set()).add(item.name)
+    # Длинные основы раньше коротких, чтобы «послезавтра» не спряталось за «завтра»
+    keywords = sorted(owners, key=len, reverse=True)
+    matcher = re.compile(
+        "|".join(f"(?P<k{index}>{keyword})" for index, keyword in enumerate(keywords)),
+        re.IGNORECASE,
+    )
+    groups = {f"k{index}": frozenset(owners[keyword]) for index, keyword in enumerate(keywords)}
+    return matcher, groups
+
+
+DATE_SETTINGS = {"PREFER_DATES_FROM": "future"}
+MONTHS = r"(?:январ|феврал|март|апрел|\bма[йя]\b|июн|июл|август|сентябр|октябр|ноябр|декабр)"
+DATE_KEYWORDS = (
+    r"\d",
+    "сегодня",
+    "послезавтра",
+    "завтра",
+    "понедельник",
+    "вторник",
+    r"сред[аеуы]",
+    "четверг",
+    "пятниц",
+    "суббот",
+    "воскресень",
+    "январ",
+    "феврал",
+    "март",
+    "апрел",
+    r"\bма[йя]\b",
+    "июн",
+    "июл",
+    "август",
+    "сентябр",
+    "октябр",
+    "ноябр",
+    "декабр",
+    "недел",
+    "месяц",
+    "через",
+)
+# Десятичные числа с единицей измерения («2.5 тыс», «3.5 тонн») датой не считаются
+AMOUNT_UNITS = r"(?:тыс|млн|млрд|тонн|т\b|кг|г\b|л\b|м\b|км|шт|руб|р\b|₽|\$|€|%|час|ч\b|мин)"
+NUMERIC_DATE = re.compile(
+    rf"(?<![\d.,])(\d{{1,2}})[./](\d{{1,2}})(?:[./](\d{{4}}|\d{{2}}))?(?![\d,]|\.\d)(?!\s*{AMOUNT_UNITS})",
+    re.IGNORECASE,
+)
+# Число, которое на деле начало даты: «25.11», «5 ноября» (но «1.5 млн» — сумма)
+NOT_A_DATE = rf"(?!\d{{1,2}}[./]\d{{1,2}}(?!\d)(?!\s*(?:тыс|млн)))(?!\d{{1,2}}\s*{MONTHS})"
+AMOUNT = r"\d{1,3}(?:[ \u00a0]\d{3})+(?:[.,]\d+)?|\d+(?:[.,]\d+)?"
+BUDGET_LINK = r"\s*(?:[:=—–-]|составля\w*|составит|будет|равен)?\s*"
+GUESTS_BEFORE = r"(?:гост|участник)\w*\s*(?:[:=—–-]|будет|около|примерно)?\s*"
+GUESTS_AFTER = r"(?:на|для|будет|будут|ожида\w*|ждём|ждем)\s+(?:около\s+|примерно\s+|до\s+)?"
+HOST_TIME_DETAIL = TIME_PATTERN
+CONTRACTOR_DETAIL = re.compile(r"подрядчик\w*\s*[:\-—]?\s*(?P<name>.*)", re.IGNORECASE | re.DOTALL)
+# Точка не конец адреса («ул. Ленина 5»), поэтому место тянется до ; или конца строки
+VENUE_DETAIL = re.compile(
+    r"(?:(?:смени|поменяй|измени|перенеси)\w*\s+(?:площадк|мест|зал)\w*\s+на"
+    r"|нов\w+\s+(?:площадк|мест)\w*\s*[:\-—]?)\s*(?P<place>[^;\n]+)",
+    re.IGNORECASE,
+)
+# Хвост, оставшийся от вырезанной даты: «Лофт Арт, срок 25.11» → «Лофт Арт»
+PLACE_TAIL = re.compile(r"(?:[\s,:;—-]+(?:до|к|срок\w*|с|от)?)+[\s.,:;—-]*$", re.IGNORECASE)
+DEADLINE_MOVE_DETAIL = re.compile(r"(?:дедлайн|срок)\w*\s*(?P<rest>[^\n]*)$", re.IGNORECASE)
+MOVE_TARGET_SPLIT = re.compile(r"\s+на\s+", re.IGNORECASE)
+BUDGET_DETAIL = re.compile(
+    rf"бюджет\w*{BUDGET_LINK}{NOT_A_DATE}(?P<amount>{AMOUNT})\s*(?P<unit>тыс|млн|k\b|к\b)?",
+    re.IGNORECASE,
+)
+GUESTS_DETAIL = re.compile(
+    rf"{GUESTS_BEFORE}{NOT_A_DATE}(?P<count>\d+)(?![.,/]?\d)"
+    rf"|{GUESTS_AFTER}(?P<count_after>\d+)\s*(?:гост|участник|человек|чел\b)",
+    re.IGNORECASE,
+)
+BUDGET_UNITS = {"тыс": 1_000, "k": 1_000, "к": 1_000, "млн": 1_000_000}
+FUZZY_SCORE_CUTOFF = 70
+
+
+def _numeric_date(match: Match[str]) -> Optional[date]:
+    """Дата вида 25.11 или 25.11.2026; без года берётся ближайшая будущая."""
+    day, month, year = match.groups()
+    today = date.today()
+    try:
+        if year:
+            return date(int(year) + (2000 if len(year) == 2 else 0), int(month), int(day))
+        found = date(today.year, int(month), int(day))
+        if found < today:
+            found = date(today.year + 1, int(month), int(day))
+        return found
+    except ValueError:
+        return None
+
+
+def _find_dates(text: str) -> List[Tuple[str, date]]:
+    """Находит даты в тексте: сначала числовые, остальное отдаёт dateparser."""
+    found: List[Tuple[str, date]] = []
+    for match in NUMERIC_DATE.finditer(text):
+        value = _numeric_date(match)
+        if value:
+            found.append((match.group(0), value))
+    rest = NUMERIC_DATE.sub(" ", text)
+    for fragment, dt in search_dates(rest, languages=["ru"], settings=DATE_SETTINGS) or []:
+        found.append((fragment, dt.date()))
+    return found
+
+
+def _parse_date(text: str) -> Optional[date]:
+    match = NUMERIC_DATE.search(text)
+    if match:
+        return _numeric_date(match)
+    dt = parse(text, languages=["ru"], settings=DATE_SETTINGS)
+    return dt.date() if dt else None
+
+
+def _capture_deadlines(
+    project: Dict[str, Any],
+    user_text: str,
+    response: Dict[str, Any],
+    not_dates: Optional[Pattern[str]] = None,
+) -> None:
+    """Ищет в тексте даты и записывает их в дедлайны проекта."""
+    date_text = not_dates.sub(" ", user_text) if not_dates else user_text
+    detected_dates = _find_dates(date_text)
+    if not detected_dates:
+        return
+    deadlines = project["sections"].setdefault("дедлайны", {"notes": []})
     deadline_entries: List[Dict[str, Any]] = deadlines.setdefault("entries", [])
-    detected_dates = search_dates(
-        user_text,
-        languages=["ru"],
-        settings={"PREFER_DATES_FROM": "future"},
-    ) or []
-    for fragment, dt in detected_dates:
+    for fragment, due_date in detected_dates:
         deadline_entries.append(
             {
-                "due_date": dt.date().isoformat(),
+                "due_date": due_date.isoformat(),
                 "context": fragment,
+                # Весь текст сообщения, чтобы потом найти дедлайн по смыслу («по смете»)
+                "description": user_text.strip(),
                 "captured_at": datetime.utcnow().isoformat(),
             }
         )
-    if detected_dates:
-        response.update(
-            {
-                "reply": "Зафиксировал дедлайны и изменения.",
-                "updated": True,
-                "summary": (response.get("summary") or "") + " дедлайны",
-            }
-        )
+    response.update(
+        {
+            "reply": "Зафиксировал дедлайны и изменения.",
+            "updated": True,
+            "summary": (response.get("summary") or "") + " дедлайны",
+        }
+    )
+
+
+@intent(
+    "host_time",
+    ("ведущ",),
+    r"^(?=.*?(?:измени|поменяй))(?=.*?ведущ)(?=.*?\d{1,2}:\d{2})",
+)
+def _change_host_time(project: Dict[str, Any], user_text: str, response: Dict[str, Any]) -> None:
+    new_time = HOST_TIME_DETAIL.search(user_text).group(1)
+    program_section = project["sections"].setdefault("программа/сценарий", {"notes": []})
+    host_info = program_section.get("ведущий", {})
+    old_time = host_info.get("time")
+    response.update(
+        {
+            "reply": (
+                f"Поменять время ведущего с {old_time or 'не задано'} на {new_time}?\n"
+                "Ответьте: ✅ Да или ⛔️ Отмена"
+            ),
+            "requires_confirmation": True,
+            "pending_change": {
+                "section": "программа/сценарий",
+                "path": ["ведущий", "time"],
+                "value": new_time,
+                "summary": f"время ведущего на {new_time}",
+                "old": old_time,
+            },
+        }
+    )
+
+
+@intent(
+    "remove_contractor",
+    ("удали", "убери", "исключи"),
+    r"(?:удали|убери|исключи)\w*\s+подрядчик",
+)
+def _remove_contractor(project: Dict[str, Any], user_text: str, response: Dict[str, Any]) -> None:
+    query = CONTRACTOR_DETAIL.search(user_text).group("name").strip(" :.-«»\"")
+    entries: List[Dict[str, Any]] = (
+        project["sections"].setdefault("подрядчики", {"notes": []}).setdefault("entries", [])
+    )
+    names = [str(entry.get("name", "")) for entry in entries]
+    match = process.extractOne(query, names, scorer=fuzz.WRatio, score_cutoff=FUZZY_SCORE_CUTOFF) if query else None
+    if not match:
+        response["reply"] = f"Не нашёл подрядчика «{query or 'без названия'}», добавил заметку в историю."
+        return
+    removed = entries.pop(match[2])
+    response.update(
+        {
+            "reply": f"Готово: удалил подрядчика {removed.get('name')}.",
+            "updated": True,
+            "summary": f"удаление подрядчика {removed.get('name')}",
+        }
+    )
+
+
+@intent(
+    "add_contractor",
+    ("добав",),
+    r"^(?=.*?добав)(?=.*?подрядчик)",
+    captures_deadlines=True,
+)
+def _add_contractor(project: Dict[str, Any], user_text: str, response: Dict[str, Any]) -> None:
+    contractor_info = CONTRACTOR_DETAIL.search(user_text).group("name").strip(" :.-") or "без названия"
+    contractors_section = project["sections"].setdefault("подрядчики", {"notes": []})
+    entries: List[Dict[str, Any]] = contractors_section.setdefault("entries", [])
+    entries.append(
+        {
+            "name": contractor_info,
+            "added_at": datetime.utcnow().isoformat(),
+        }
+    )
+    response.update(
+        {
+            "reply": f"Готово: добавил подрядчика {contractor_info}.",
+            "updated": True,
+            "summary": f"подрядчик {contractor_info}",
+        }
+    )
+
+
+@intent(
+    "move_deadline",
+    ("перенес", "сдвин", "передвин"),
+    r"(?:перенес|сдвин|передвин)\w*\s+(?:дедлайн|срок).*?\sна\s",
+)
+def _move_deadline(project: Dict[str, Any], user_text: str, response: Dict[str, Any]) -> None:
+    detail = DEADLINE_MOVE_DETAIL.search(user_text)
+    entries: List[Dict[str, Any]] = (
+        project["sections"].setdefault("дедлайны", {"notes": []}).setdefault("entries", [])
+    )
+    if not detail or not entries:
+        response["reply"] = "Не нашёл дедлайн для переноса, добавил заметку в историю."
+        return
+    # «перенеси срок на монтаж на 5 ноября»: датой считается хвост после последнего
+    # «на», который действительно разбирается как дата
+    rest = detail.group("rest")
+    what, new_date = "", None
+    for split in reversed(list(MOVE_TARGET_SPLIT.finditer(f" {rest}"))):
+        new_date = _parse_date(f" {rest}"[split.end():])
+        if new_date:
+            what = f" {rest}"[: split.start()]
+            break
+    if not new_date:
+        response["reply"] = "Не понял новую дату дедлайна, добавил заметку в историю."
+        return
+
+    query = re.sub(r"^(?:по|для|на)\s+", "", what.strip(), flags=re.IGNORECASE)
+    index = len(entries) - 1
+    if query:
+        # Старые дедлайны без description находятся только по дате из context
+        choices = [f"{entry.get('description') or ''} {entry.get('context') or ''}" for entry in entries]
+        match = process.extractOne(query, choices, scorer=fuzz.WRatio, score_cutoff=FUZZY_SCORE_CUTOFF)
+        if not match:
+            response["reply"] = f"Не нашёл дедлайн «{query}», добавил заметку в историю."
+            return
+        index = match[2]
+
+    entry = entries[index]
+    old_date = entry.get("due_date")
+    entry["due_date"] = new_date.isoformat()
+    entry["moved_at"] = datetime.utcnow().isoformat()
+    response.update(
+        {
+            "reply": f"Готово: перенёс дедлайн с {old_date} на {entry['due_date']}.",
+            "updated": True,
+            "summary": f"дедлайн «{entry.get('context')}» на {entry['due_date']}",
+        }
+    )
+
+
+@intent(
+    "venue",
+    ("площадк", "мест", "зал"),
+    r"(?:смени|поменяй|измени|перенеси)\w*\s+(?:площадк|мест|зал)\w*\s+на|нов\w+\s+(?:площадк|мест)",
+    captures_deadlines=True,
+)
+def _change_venue(project: Dict[str, Any], user_text: str, response: Dict[str, Any]) -> None:
+    # Даты относятся к дедлайнам, а не к адресу: вырезаем их до разбора места
+    place_text = NUMERIC_DATE.sub(" ", user_text)
+    for fragment, _ in _find_dates(place_text):
+        place_text = place_text.replace(fragment, " ")
+    detail = VENUE_DETAIL.search(place_text)
+    place = PLACE_TAIL.sub("", detail.group("place")).strip(" :-") if detail else ""
+    if not place:
+        response["reply"] = "Не понял, на какую площадку поменять, добавил заметку в историю."
+        return
+    old_place = project.get("place")
+    project["place"] = place
+    project["sections"].setdefault("площадка", {"notes": []}).setdefault("notes", []).append(user_text.strip())
+    response.update(
+        {
+            "reply": f"Готово: площадка {old_place or 'не задана'} → {place}.",
+            "updated": True,
+            "summary": f"площадку на {place}",
+        }
+    )
+
+
+@intent(
+    "budget",
+    ("бюджет",),
+    BUDGET_DETAIL.pattern,
+    captures_deadlines=True,
+    not_dates=BUDGET_DETAIL,
+)
+def _set_budget(project: Dict[str, Any], user_text: str, response: Dict[str, Any]) -> None:
+    detail = BUDGET_DETAIL.search(user_text)
+    amount = float(re.sub(r"\s", "", detail.group("amount")).replace(",", "."))
+    unit = (detail.group("unit") or "").lower()
+    project["budget"] = round(amount * BUDGET_UNITS.get(unit, 1))
+    response.update(
+        {
+            "reply": f"Готово: бюджет {project['budget']}.",
+            "updated": True,
+            "summary": f"бюджет на {project['budget']}",
+        }
+    )
+
+
+@intent(
+    "guests",
+    ("гост", "участник", "человек", "чел"),
+    GUESTS_DETAIL.pattern,
+    captures_deadlines=True,
+    not_dates=GUESTS_DETAIL,
+)
+def _set_guests(project: Dict[str, Any], user_text: str, response: Dict[str, Any]) -> None:
+    detail = GUESTS_DETAIL.search(user_text)
+    project["guests"] = int(detail.group("count") or detail.group("count_after"))
+    response.update(
+        {
+            "reply": f"Готово: гостей {project['guests']}.",
+            "updated": True,
+            "summary": f"количество гостей на {project['guests']}",
+        }
+    )
+
+
+@intent(
+    "deadlines",
+    DATE_KEYWORDS,
+    "|".join(DATE_KEYWORDS),
+    captures_deadlines=True,
+)
+def _deadlines_only(project: Dict[str, Any], user_text: str, response: Dict[str, Any]) -> None:
+    """Даты ищет общий шаг `_capture_deadlines`."""
+
+
+KEYWORD_MATCHER, _KEYWORD_OWNERS = _compile_keywords(_INTENTS)
+
+
+def match_intent(user_text: str) -> Optional[Intent]:
+    """Определяет намерение: один проход по ключевым словам и проверка кандидатов."""
+    candidates: Set[str] = set()
+    for match in KEYWORD_MATCHER.finditer(user_text):
+        candidates |= _KEYWORD_OWNERS[match.lastgroup]
+    for item in _INTENTS:
+        if item.name in candidates and item.pattern.search(user_text):
+            return item
+    return None
+
+
+def apply_change(project: Dict[str, Any], user_text: str) -> Dict[str, Any]:
+    """Пытается применить изменение к проекту."""
+    project.setdefault("sections", {})
+    response: Dict[str, Any] = {
+        "reply": "Не нашёл конкретного действия, добавил заметку в историю.",
+        "updated": False,
+        "requires_confirmation": False,
+        "pending_change": None,
+        "summary": None,
+    }
+
+    matched = match_intent(user_text)
+    if matched:
+        matched.handler(project, user_text, response)
+        if response["requires_confirmation"]:
+            return response
+        if matched.captures_deadlines:
+            _capture_deadlines(project, user_text, response, matched.not_dates)
 
     if response["updated"]:
         project.setdefault("history", []).append(
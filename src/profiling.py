@@ -0,0 +1,195 @@
+"""Профилирование живого бота по запросу администратора.
+
+Пока сессия не запущена, обработчик текста работает без обёртки: профилировщик
+подменяет callback у MessageHandler только на время сессии.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import re
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from telegram import Update
+from telegram.ext import BaseHandler, ContextTypes
+
+LOGGER = logging.getLogger(__name__)
+
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 15
+TRACEMALLOC_FRAMES = 5
+# Каталог кода бота: по нему отчёт отделяет функции проекта от библиотек и цикла событий
+PROJECT_DIR = str(Path(__file__).resolve().parent)
+REPORT_NOTE = (
+    "Внимание: cProfile включён на всё время await обработчика. Пока обработчик ждёт\n"
+    "ответа Telegram, цикл событий выполняет и другие корутины (polling, другие чаты),\n"
+    "и они тоже попадают в общую таблицу. Таблица «код проекта» оставляет только src/.\n"
+)
+
+Callback = Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]
+
+
+@dataclass
+class ProfilingSession:
+    """Параметры и накопленные данные текущей сессии профилирования."""
+
+    remaining: int
+    report_chat_id: int
+    state: Optional[str] = None
+    chat_id: Optional[int] = None
+    profiled: int = 0
+    profiler: cProfile.Profile = field(default_factory=cProfile.Profile)
+    snapshot_before: Optional[tracemalloc.Snapshot] = None
+    started_tracemalloc: bool = False
+
+    def matches(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
+        if self.chat_id is not None and (
+            not update.effective_chat or update.effective_chat.id != self.chat_id
+        ):
+            return False
+        if self.state is not None and context.user_data.get("state") != self.state:
+            return False
+        return True
+
+
+_handler: Optional[BaseHandler[Any, Any, Any]] = None
+_original_callback: Optional[Callback] = None
+_session: Optional[ProfilingSession] = None
+
+
+def install(handler: BaseHandler[Any, Any, Any]) -> None:
+    """Запоминает обработчик, чей callback будет профилироваться."""
+    global _handler
+    _handler = handler
+
+
+def is_active() -> bool:
+    return _session is not None
+
+
+def start(
+    updates: int,
+    report_chat_id: int,
+    state: Optional[str] = None,
+    chat_id: Optional[int] = None,
+) -> None:
+    """Включает профилирование следующих `updates` подходящих сообщений."""
+    global _session, _original_callback
+    if _handler is None:
+        raise RuntimeError("Профилировщик не подключён к обработчику сообщений")
+    if _session is not None:
+        raise RuntimeError("Профилирование уже запущено")
+    if updates <= 0:
+        raise ValueError("Количество сообщений должно быть положительным")
+
+    session = ProfilingSession(
+        remaining=updates,
+        report_chat_id=report_chat_id,
+        state=state,
+        chat_id=chat_id,
+    )
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        session.started_tracemalloc = True
+    session.snapshot_before = tracemalloc.take_snapshot()
+
+    _session = session
+    _original_callback = _handler.callback
+    _handler.callback = _profiled_callback
+    LOGGER.info(
+        "Профилирование включено: %s сообщений, state=%s, chat=%s", updates, state, chat_id
+    )
+
+
+def stop() -> Optional[tuple[ProfilingSession, str]]:
+    """Выключает профилирование и возвращает сессию вместе с отчётом."""
+    global _session, _original_callback
+    session = _session
+    if session is None:
+        return None
+    if _handler is not None and _original_callback is not None:
+        _handler.callback = _original_callback
+    _session = None
+    _original_callback = None
+
+    snapshot_after = tracemalloc.take_snapshot()
+    if session.started_tracemalloc:
+        tracemalloc.stop()
+    report = _build_report(session, snapshot_after)
+    LOGGER.info("Профилирование выключено, обработано %s сообщений", session.profiled)
+    return session, report
+
+
+def _build_report(session: ProfilingSession, snapshot_after: tracemalloc.Snapshot) -> str:
+    out = io.StringIO()
+    out.write(f"Профилировано сообщений: {session.profiled}\n")
+    out.write(f"Фильтры: state={session.state or '—'}, chat={session.chat_id or '—'}\n")
+    out.write(REPORT_NOTE + "\n")
+
+    if session.profiled:
+        out.write(f"Топ-{TOP_FUNCTIONS} функций кода проекта по суммарному времени:\n")
+        stats = pstats.Stats(session.profiler, stream=out)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(re.escape(PROJECT_DIR), TOP_FUNCTIONS)
+        out.write(f"\nТоп-{TOP_FUNCTIONS} функций всего процесса по суммарному времени:\n")
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+    else:
+        out.write("Профиль функций: нет данных\n")
+
+    out.write(f"\nТоп-{TOP_ALLOCATIONS} мест выделения памяти (прирост):\n")
+    if session.snapshot_before is not None:
+        snapshot_filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ]
+        before = session.snapshot_before.filter_traces(snapshot_filters)
+        after = snapshot_after.filter_traces(snapshot_filters)
+        for stat in after.compare_to(before, "lineno")[:TOP_ALLOCATIONS]:
+            out.write(f"{stat}\n")
+    return out.getvalue()
+
+
+async def _profiled_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    session = _session
+    callback = _original_callback
+    if session is None or callback is None:
+        # Сессию успели закрыть, а обновление уже было в очереди с подменённым callback
+        if _handler is not None and _handler.callback is not _profiled_callback:
+            await _handler.callback(update, context)
+        return
+
+    if not session.matches(update, context):
+        await callback(update, context)
+        return
+
+    session.profiler.enable()
+    try:
+        await callback(update, context)
+    finally:
+        session.profiler.disable()
+        session.profiled += 1
+        session.remaining -= 1
+
+    if session.remaining <= 0:
+        await send_report(context, stop())
+
+
+async def send_report(
+    context: ContextTypes.DEFAULT_TYPE,
+    result: Optional[tuple[ProfilingSession, str]],
+) -> None:
+    """Отправляет отчёт профилирования документом в чат администратора."""
+    if result is None:
+        return
+    session, report = result
+    await context.bot.send_document(
+        chat_id=session.report_chat_id,
+        document=report.encode("utf-8"),
+        filename="eventpilot_profile.txt",
+        caption=f"Профиль {session.profiled} сообщений.",
+    )
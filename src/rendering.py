@@ -0,0 +1,86 @@
+"""Тексты ответов по проектам с кэшированием по ревизии.
+
+Карточка зависит только от сохранённого состояния проекта, поэтому ключом кэша
+служит пара (event_id, revision): после любого сохранения ревизия растёт, и
+старые записи просто перестают запрашиваться.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from src import storage
+
+CACHE_MAX_SIZE = 512
+
+_cache: "OrderedDict[Tuple[str, str, int], str]" = OrderedDict()
+
+
+def _render_project_card(project: Dict[str, Any]) -> str:
+    sections = project.get("sections", {})
+    deadlines = sections.get("дедлайны", {}).get("entries", [])
+    deadlines_text = "\n".join(
+        f"— {item.get('due_date')} — {item.get('context')}" for item in deadlines[:3]
+    )
+    extra = ""
+    if project.get("budget") is not None:
+        extra += f"Бюджет: {project['budget']}\n"
+    if project.get("guests") is not None:
+        extra += f"Гостей: {project['guests']}\n"
+    return (
+        f"Проект: {project.get('title')}\n"
+        f"Дата: {project.get('date') or 'не указана'} {project.get('time') or ''}\n"
+        f"Место: {project.get('place') or 'не указано'}\n"
+        f"Аудитория: {project.get('audience') or 'не указана'}\n"
+        f"{extra}"
+        f"Дедлайны:\n{deadlines_text or 'пока нет'}"
+    )
+
+
+def _render_created_summary(project: Dict[str, Any]) -> str:
+    sections = project.get("sections", {})
+    section_names = ", ".join(name for name, data in sections.items() if data.get("notes"))
+    if not section_names:
+        section_names = ", ".join(sections.keys())
+    return (
+        f"Создано: {project.get('title')} — "
+        f"{project.get('date') or 'дата не указана'} "
+        f"{project.get('time') or ''} — {project.get('place') or 'место не указано'}.\n"
+        f"Папки: {section_names}."
+    )
+
+
+def _cached(kind: str, project: Dict[str, Any], render: Callable[[Dict[str, Any]], str]) -> str:
+    event_id = project.get("event_id")
+    if not event_id:
+        return render(project)
+    key = (kind, event_id, storage.project_revision(project))
+    text = _cache.get(key)
+    if text is not None:
+        _cache.move_to_end(key)
+        return text
+    text = render(project)
+    _cache[key] = text
+    if len(_cache) > CACHE_MAX_SIZE:
+        _cache.popitem(last=False)
+    return text
+
+
+def project_card(project: Dict[str, Any]) -> str:
+    """Карточка сохранённого проекта."""
+    return _cached("card", project, _render_project_card)
+
+
+def created_summary(project: Dict[str, Any]) -> str:
+    """Сообщение о только что созданном проекте.
+
+    Не кэшируется: у каждого нового проекта свой event_id, и запись никогда
+    не была бы прочитана повторно, а лишь вытесняла бы карточки из кэша.
+    """
+    return _render_created_summary(project)
+
+
+def clear_cache() -> None:
+    """Сбрасывает все закэшированные тексты."""
+    _cache.clear()
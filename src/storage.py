@@ -4,20 +4,53 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: межпроцессная блокировка недоступна
+    fcntl = None
 
 LOGGER = logging.getLogger(__name__)
 
 DATA_DIR = Path("data")
 PROJECTS_DIR = DATA_DIR / "projects"
+LOCKS_DIR = DATA_DIR / "locks"
+
+_LOCKS_GUARD = threading.Lock()
+_PROJECT_LOCKS: Dict[str, threading.Lock] = {}
+
+
+class RevisionConflict(Exception):
+    """Проект успели изменить после загрузки."""
+
+    def __init__(self, event_id: str, expected: int, actual: int) -> None:
+        super().__init__(
+            f"Конфликт ревизий проекта {event_id}: ожидалась {expected}, на диске {actual}"
+        )
+        self.event_id = event_id
+        self.expected = expected
+        self.actual = actual
+
+
+def set_data_dir(path: Path) -> None:
+    """Переключает хранилище на другой каталог данных (тесты, бенчмарки)."""
+    global DATA_DIR, PROJECTS_DIR, LOCKS_DIR
+    DATA_DIR = Path(path)
+    PROJECTS_DIR = DATA_DIR / "projects"
+    LOCKS_DIR = DATA_DIR / "locks"
 
 
 def ensure_storage() -> None:
     """Гарантирует наличие директорий для хранения данных."""
     PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
+    LOCKS_DIR.mkdir(parents=True, exist_ok=True)
 
 
 @dataclass
@@ -36,18 +69,68 @@ def _project_path(event_id: str) -> Path:
     return PROJECTS_DIR / f"{event_id}.json"
 
 
-def save_project(project: Dict[str, Any]) -> None:
-    """Сохраняет проект на диск."""
-    ensure_storage()
+def _project_lock(event_id: str) -> threading.Lock:
+    with _LOCKS_GUARD:
+        lock = _PROJECT_LOCKS.get(event_id)
+        if lock is None:
+            lock = _PROJECT_LOCKS[event_id] = threading.Lock()
+        return lock
+
+
+@contextmanager
+def _locked(event_id: str) -> Iterator[None]:
+    """Блокирует проект для потоков этого процесса и для других процессов."""
+    with _project_lock(event_id):
+        if fcntl is None:
+            yield
+            return
+        with (LOCKS_DIR / f"{event_id}.lock").open("a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_project(project: Dict[str, Any]) -> None:
+    """Атомарно записывает проект: через временный файл и os.replace."""
     path = _project_path(project["event_id"])
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
     try:
-        with path.open("w", encoding="utf-8") as f:
+        with tmp_path.open("w", encoding="utf-8") as f:
             json.dump(project, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
     except OSError as err:
         LOGGER.error("Не удалось записать проект %s: %s", project["event_id"], err)
+        tmp_path.unlink(missing_ok=True)
         raise
 
 
+def _read_revision(event_id: str) -> int:
+    path = _project_path(event_id)
+    if not path.exists():
+        return 0
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return int(json.load(f).get("revision", 0))
+    except (OSError, json.JSONDecodeError, TypeError, ValueError) as err:
+        LOGGER.warning("Не удалось прочитать ревизию %s: %s", event_id, err)
+        return 0
+
+
+def project_revision(project: Dict[str, Any]) -> int:
+    """Возвращает ревизию загруженного проекта."""
+    return int(project.get("revision", 0))
+
+
+def save_project(project: Dict[str, Any]) -> None:
+    """Сохраняет проект на диск."""
+    ensure_storage()
+    with _locked(project["event_id"]):
+        project.setdefault("revision", 1)
+        _write_project(project)
+
+
 def load_project(event_id: str) -> Optional[Dict[str, Any]]:
     """Загружает проект по идентификатору."""
     path = _project_path(event_id)
@@ -61,6 +144,20 @@ def load_project(event_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def iter_projects() -> Iterator[Dict[str, Any]]:
+    """Лениво перебирает все проекты, не загружая их в память разом."""
+    ensure_storage()
+    with os.scandir(PROJECTS_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            try:
+                with open(entry.path, "r", encoding="utf-8") as f:
+                    yield json.load(f)
+            except (OSError, json.JSONDecodeError) as err:
+                LOGGER.warning("Ошибка чтения %s: %s", entry.path, err)
+
+
 def list_projects(limit: int = 10) -> List[ProjectSummary]:
     """Возвращает последние проекты."""
     ensure_storage()
@@ -92,7 +189,24 @@ def list_projects(limit: int = 10) -> List[ProjectSummary]:
 
 
 def update_project(project: Dict[str, Any]) -> None:
-    """Обновляет данные проекта."""
+    """Обновляет данные проекта с проверкой ревизии (compare-and-swap).
+
+    Запись проходит, только если ревизия на диске совпадает с ревизией,
+    с которой проект был загружен; иначе поднимается RevisionConflict,
+    и вызывающий код должен перечитать проект и повторить изменение.
+    """
     if "event_id" not in project:
         raise ValueError("В проекте отсутствует event_id")
-    save_project(project)
+    ensure_storage()
+    event_id = project["event_id"]
+    expected = project_revision(project)
+    with _locked(event_id):
+        actual = _read_revision(event_id)
+        if actual != expected:
+            raise RevisionConflict(event_id, expected, actual)
+        project["revision"] = expected + 1
+        try:
+            _write_project(project)
+        except OSError:
+            project["revision"] = expected
+            raise
@@ -0,0 +1,198 @@
+"""Многопроцессный режим: фронт получает обновления и раздаёт их воркерам.
+
+Фронт опрашивает Telegram и кладёт каждое обновление в очередь воркера,
+выбранного по id чата. Поэтому состояние диалога (user_data) конкретного чата
+всегда живёт в одном процессе. Проекты воркеры делят через storage, где запись
+защищена файловой блокировкой и проверкой ревизии.
+
+Профилирование (/profile) работает внутри одного воркера: команда уходит
+воркеру чата из аргумента chat=<id>, а без него — воркеру чата администратора,
+и в отчёт попадают только сообщения этого воркера.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import queue as queue_errors
+from datetime import timedelta
+from multiprocessing.context import SpawnContext
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+from typing import Any, Callable, Dict, List, Optional
+
+from telegram import Bot, Update
+from telegram.error import InvalidToken, RetryAfter, TelegramError
+from telegram.ext import Application
+
+LOGGER = logging.getLogger(__name__)
+
+POLL_TIMEOUT = 30
+POLL_ERROR_DELAY = 5
+QUEUE_MAX_SIZE = 1000
+QUEUE_PUT_TIMEOUT = 5
+
+ApplicationFactory = Callable[[str], Application]
+
+
+def worker_index(chat_id: Optional[int], workers: int) -> int:
+    """Номер воркера для чата: один и тот же для всех его сообщений."""
+    if chat_id is None:
+        return 0
+    return abs(chat_id) % workers
+
+
+def _profile_target_chat(text: str) -> Optional[int]:
+    """Чат из аргумента chat=<id> команды /profile."""
+    for arg in text.split()[1:]:
+        key, _, value = arg.partition("=")
+        if key == "chat" and value.lstrip("-").isdigit():
+            return int(value)
+    return None
+
+
+async def _run_worker(index: int, token: str, queue: Queue, factory: ApplicationFactory) -> None:
+    application = factory(token)
+    await application.initialize()
+    await application.start()
+    LOGGER.info("Воркер %s запущен", index)
+    try:
+        while True:
+            data: Optional[Dict[str, Any]] = await asyncio.to_thread(queue.get)
+            if data is None:
+                break
+            update = Update.de_json(data, application.bot)
+            if update is not None:
+                await application.process_update(update)
+    finally:
+        await application.stop()
+        await application.shutdown()
+        LOGGER.info("Воркер %s остановлен", index)
+
+
+def _worker_main(index: int, token: str, queue: Queue, factory: ApplicationFactory) -> None:
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_run_worker(index, token, queue, factory))
+    except KeyboardInterrupt:
+        pass
+
+
+class WorkerPool:
+    """Процессы-обработчики с очередями и перезапуском упавших воркеров."""
+
+    def __init__(self, token: str, workers: int, factory: ApplicationFactory) -> None:
+        self._ctx: SpawnContext = multiprocessing.get_context("spawn")
+        self._token = token
+        self._factory = factory
+        self.queues: List[Queue] = [self._ctx.Queue(maxsize=QUEUE_MAX_SIZE) for _ in range(workers)]
+        self.processes: List[Optional[BaseProcess]] = [None] * workers
+        self._profile_worker: Optional[int] = None
+
+    def start(self) -> None:
+        for index in range(len(self.queues)):
+            self._spawn(index)
+
+    def _spawn(self, index: int) -> None:
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(index, self._token, self.queues[index], self._factory),
+            name=f"eventpilot-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        self.processes[index] = process
+
+    def ensure_alive(self, index: int) -> None:
+        """Перезапускает воркер, если его процесс завершился."""
+        process = self.processes[index]
+        if process is not None and process.is_alive():
+            return
+        LOGGER.error(
+            "Воркер %s завершился с кодом %s, перезапускаем",
+            index,
+            process.exitcode if process else None,
+        )
+        self._spawn(index)
+
+    def route(self, update: Update) -> int:
+        """Выбирает воркер для обновления."""
+        workers = len(self.queues)
+        chat_id = update.effective_chat.id if update.effective_chat else None
+        message = update.effective_message
+        text = (message.text or "") if message else ""
+        if text.split("@", 1)[0].split(" ", 1)[0] == "/profile":
+            # Профилировщик живёт в процессе, чей callback он подменяет
+            target = _profile_target_chat(text)
+            if target is not None:
+                self._profile_worker = worker_index(target, workers)
+            elif self._profile_worker is None or "stop" not in text.split()[1:2]:
+                self._profile_worker = worker_index(chat_id, workers)
+            return self._profile_worker
+        return worker_index(chat_id, workers)
+
+    async def dispatch(self, update: Update) -> None:
+        index = self.route(update)
+        self.ensure_alive(index)
+        try:
+            await asyncio.to_thread(
+                self.queues[index].put, update.to_dict(), timeout=QUEUE_PUT_TIMEOUT
+            )
+        except queue_errors.Full:
+            LOGGER.error(
+                "Очередь воркера %s переполнена, обновление %s пропущено", index, update.update_id
+            )
+
+    def stop(self, join_timeout: Optional[float] = 10) -> None:
+        """Останавливает воркеры; `join_timeout=None` ждёт, пока они разберут очереди."""
+        for queue in self.queues:
+            try:
+                queue.put(None, timeout=QUEUE_PUT_TIMEOUT if join_timeout is not None else None)
+            except queue_errors.Full:
+                pass
+        for process in self.processes:
+            if process is None:
+                continue
+            process.join(timeout=join_timeout)
+            if process.is_alive():
+                process.terminate()
+
+
+def _retry_delay(err: TelegramError) -> float:
+    if isinstance(err, RetryAfter):
+        retry_after = err.retry_after
+        if isinstance(retry_after, timedelta):
+            return retry_after.total_seconds()
+        return float(retry_after)
+    return POLL_ERROR_DELAY
+
+
+async def _poll(bot: Bot, pool: WorkerPool) -> None:
+    offset: Optional[int] = None
+    while True:
+        try:
+            updates = await bot.get_updates(offset=offset, timeout=POLL_TIMEOUT)
+        except InvalidToken:
+            raise
+        except TelegramError as err:
+            delay = _retry_delay(err)
+            LOGGER.warning("Ошибка получения обновлений: %s, повтор через %s с", err, delay)
+            await asyncio.sleep(delay)
+            continue
+        for update in updates:
+            offset = update.update_id + 1
+            await pool.dispatch(update)
+
+
+async def run(token: str, workers: int, factory: ApplicationFactory) -> None:
+    """Запускает фронт с polling и `workers` процессов-обработчиков."""
+    pool = WorkerPool(token, workers, factory)
+    pool.start()
+    LOGGER.info("Запускаем EventPilot с %s воркерами", workers)
+    try:
+        async with Bot(token) as bot:
+            await bot.delete_webhook()
+            await _poll(bot, pool)
+    finally:
+        pool.stop()
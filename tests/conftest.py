@@ -0,0 +1,18 @@
+"""Общие фикстуры тестов."""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from src import storage
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Iterator[Path]:
+    """Изолированный каталог данных для одного теста."""
+    original = storage.DATA_DIR
+    storage.set_data_dir(tmp_path)
+    storage.ensure_storage()
+    yield tmp_path
+    storage.set_data_dir(original)
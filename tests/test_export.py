@@ -0,0 +1,104 @@
+"""Тесты выгрузки проектов."""
+
+import asyncio
+import gzip
+import io
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src import export, storage
+from src.handlers import export as export_handler
+
+PROJECT = {
+    "event_id": "e1",
+    "title": "Форум",
+    "sections": {
+        "дедлайны": {"notes": [], "entries": [{"due_date": "2026-11-25", "context": "25.11"}]},
+        "подрядчики": {"notes": [], "entries": [{"name": "Иванов", "added_at": "2026-10-01"}]},
+        "программа/сценарий": {"notes": ["тайминг"], "ведущий": {"time": "21:00"}},
+    },
+}
+
+
+def _fake_update(user_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id),
+        message=SimpleNamespace(reply_text=AsyncMock(), reply_document=AsyncMock()),
+    )
+
+
+def test_project_is_flattened_into_records() -> None:
+    records = list(export.iter_project_records(PROJECT))
+    kinds = [(record["record"], record.get("value")) for record in records]
+    assert kinds == [
+        ("project", None),
+        ("deadline", "25.11"),
+        ("contractor", "Иванов"),
+        ("note", "тайминг"),
+        ("field", "21:00"),
+    ]
+
+
+def test_jsonl_export_writes_one_record_per_line() -> None:
+    buffer = io.BytesIO()
+    count = export.write_export(export.iter_records([PROJECT]), "jsonl", buffer)
+    lines = buffer.getvalue().decode("utf-8").splitlines()
+    assert count == len(lines) == 5
+    assert json.loads(lines[1])["due_date"] == "2026-11-25"
+
+
+def test_export_is_refused_to_non_admins(
+    data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ADMIN_IDS", "1")
+    storage.save_project(dict(PROJECT))
+    update = _fake_update(user_id=2)
+    asyncio.run(export_handler.export_projects(update, SimpleNamespace(args=[])))
+    update.message.reply_document.assert_not_called()
+
+
+def test_export_is_sent_to_admins(data_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADMIN_IDS", "1")
+    storage.save_project(dict(PROJECT))
+    update = _fake_update(user_id=1)
+    asyncio.run(export_handler.export_projects(update, SimpleNamespace(args=["csv"])))
+    update.message.reply_document.assert_awaited_once()
+
+
+def _save_many(count: int) -> None:
+    for number in range(count):
+        storage.save_project({**PROJECT, "event_id": f"e{number}"})
+
+
+def test_large_export_is_sent_gzipped(data_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ADMIN_IDS", "1")
+    monkeypatch.setattr(export_handler, "MAX_UPLOAD_SIZE", 4096)
+    _save_many(50)
+    sent = {}
+
+    async def capture(document, filename, **kwargs):
+        sent["filename"] = filename
+        sent["data"] = gzip.decompress(document.read())
+
+    update = _fake_update(user_id=1)
+    update.message.reply_document = AsyncMock(side_effect=capture)
+    asyncio.run(export_handler.export_projects(update, SimpleNamespace(args=["csv"])))
+    assert sent["filename"] == "eventpilot_projects.csv.gz"
+    assert len(sent["data"]) > 4096
+    assert sent["data"].decode("utf-8-sig").count("\n") == 50 * 5 + 1
+
+
+def test_oversize_export_is_reported_instead_of_sent(
+    data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ADMIN_IDS", "1")
+    monkeypatch.setattr(export_handler, "MAX_UPLOAD_SIZE", 64)
+    _save_many(50)
+    update = _fake_update(user_id=1)
+    asyncio.run(export_handler.export_projects(update, SimpleNamespace(args=["csv"])))
+    update.message.reply_document.assert_not_called()
+    assert "слишком большая" in update.message.reply_text.await_args.args[0]
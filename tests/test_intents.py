@@ -0,0 +1,38 @@
+"""Тесты разбора правок проекта по корпусу сообщений."""
+
+import pytest
+
+from benchmarks.intent_corpus import CORPUS, IntentCase, fresh_project, observe
+from src import nlp
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[case.text for case in CORPUS])
+def test_message_matches_expected_intent(case: IntentCase) -> None:
+    matched = nlp.match_intent(case.text)
+    assert (matched.name if matched else None) == case.intent
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[case.text for case in CORPUS])
+def test_message_produces_expected_fields(case: IntentCase) -> None:
+    project = fresh_project()
+    response = nlp.apply_change(project, case.text)
+    observed = observe(project, response)
+    assert {key: observed[key] for key in case.expected} == case.expected
+
+
+def test_dateparser_is_skipped_without_date_intent(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("search_dates не должен вызываться")
+
+    monkeypatch.setattr(nlp, "search_dates", fail)
+    nlp.apply_change(fresh_project(), "удали подрядчика Иванов")
+    nlp.apply_change(fresh_project(), "просто заметка")
+
+
+def test_captured_deadline_keeps_message_for_later_moves() -> None:
+    project = fresh_project()
+    nlp.apply_change(project, "оплатить кейтеринг до 12.11")
+    nlp.apply_change(project, "перенеси дедлайн по кейтерингу на 20.11")
+    entry = project["sections"]["дедлайны"]["entries"][2]
+    assert entry["description"] == "оплатить кейтеринг до 12.11"
+    assert entry["due_date"].endswith("-11-20")
@@ -0,0 +1,122 @@
+"""Тесты профилирования живого бота."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Iterator, List, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+from telegram.ext import MessageHandler, filters
+
+from src import profiling
+from src.handlers import admin
+
+ADMIN_ID = 1
+
+
+@pytest.fixture
+def handled() -> List[int]:
+    return []
+
+
+@pytest.fixture
+def text_handler(handled: List[int]) -> Iterator[MessageHandler]:
+    async def handle_text(update: SimpleNamespace, context: SimpleNamespace) -> None:
+        handled.append(update.effective_chat.id)
+
+    handler = MessageHandler(filters.TEXT, handle_text)
+    profiling.install(handler)
+    yield handler
+    profiling.stop()
+    profiling.install(None)
+
+
+def _update(chat_id: int, user_id: int = ADMIN_ID) -> SimpleNamespace:
+    return SimpleNamespace(
+        effective_chat=SimpleNamespace(id=chat_id),
+        effective_user=SimpleNamespace(id=user_id),
+        message=SimpleNamespace(reply_text=AsyncMock()),
+    )
+
+
+def _context(state: Optional[str] = None, args: Optional[List[str]] = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        user_data={"state": state} if state else {},
+        args=args or [],
+        bot=SimpleNamespace(send_document=AsyncMock()),
+    )
+
+
+def test_start_swaps_callback_and_stop_restores_it(text_handler: MessageHandler) -> None:
+    original = text_handler.callback
+    profiling.start(3, report_chat_id=ADMIN_ID)
+    assert text_handler.callback is profiling._profiled_callback
+    assert profiling.is_active()
+
+    session, report = profiling.stop()
+    assert text_handler.callback is original
+    assert not profiling.is_active()
+    assert session.profiled == 0
+    assert profiling.REPORT_NOTE in report
+
+
+@pytest.mark.parametrize(
+    "state, chat_id, updates, expected",
+    [
+        ("project_edit", None, [(10, "project_edit"), (11, None), (12, "project_edit")], 2),
+        (None, 20, [(20, None), (21, None), (20, "project_edit")], 2),
+    ],
+)
+def test_filters_skip_non_matching_updates(
+    text_handler: MessageHandler,
+    handled: List[int],
+    state: Optional[str],
+    chat_id: Optional[int],
+    updates: list,
+    expected: int,
+) -> None:
+    profiling.start(10, report_chat_id=ADMIN_ID, state=state, chat_id=chat_id)
+    for update_chat, update_state in updates:
+        asyncio.run(text_handler.callback(_update(update_chat), _context(update_state)))
+
+    assert handled == [update_chat for update_chat, _ in updates]
+    assert profiling._session.profiled == expected
+
+
+def test_report_is_sent_after_n_matching_updates(
+    text_handler: MessageHandler, handled: List[int]
+) -> None:
+    original = text_handler.callback
+    profiling.start(2, report_chat_id=ADMIN_ID, chat_id=30)
+    context = _context()
+    for chat_id in (30, 31, 30):
+        asyncio.run(text_handler.callback(_update(chat_id), context))
+
+    assert handled == [30, 31, 30]
+    assert not profiling.is_active()
+    assert text_handler.callback is original
+    context.bot.send_document.assert_awaited_once()
+    sent = context.bot.send_document.await_args.kwargs
+    assert sent["chat_id"] == ADMIN_ID
+    assert b"handle_text" in sent["document"]
+
+
+def test_profile_stop_without_session(
+    text_handler: MessageHandler, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ADMIN_IDS", str(ADMIN_ID))
+    update = _update(ADMIN_ID)
+    context = _context(args=["stop"])
+    asyncio.run(admin.profile(update, context))
+    update.message.reply_text.assert_awaited_once_with("Профилирование не запущено.")
+    context.bot.send_document.assert_not_called()
+
+
+def test_profile_is_refused_to_non_admins(
+    text_handler: MessageHandler, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("ADMIN_IDS", str(ADMIN_ID))
+    update = _update(ADMIN_ID, user_id=2)
+    asyncio.run(admin.profile(update, _context(args=["5"])))
+    update.message.reply_text.assert_awaited_once_with("Команда доступна только администраторам.")
+    assert not profiling.is_active()
@@ -0,0 +1,30 @@
+"""Тесты кэша карточек проектов и клавиатур."""
+
+import pytest
+
+from src import keyboards, rendering
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> None:
+    rendering.clear_cache()
+
+
+def test_card_is_cached_until_revision_changes() -> None:
+    project = {"event_id": "e1", "revision": 1, "title": "Старое", "sections": {}}
+    first = rendering.project_card(project)
+    project["title"] = "Новое"
+    assert rendering.project_card(project) is first
+
+    project["revision"] = 2
+    assert "Новое" in rendering.project_card(project)
+
+
+def test_created_summary_does_not_fill_card_cache() -> None:
+    rendering.created_summary({"event_id": "e2", "title": "Форум", "sections": {}})
+    assert not rendering._cache
+
+
+def test_static_keyboards_are_built_once() -> None:
+    assert keyboards.main_menu_keyboard() is keyboards.main_menu_keyboard()
+    assert keyboards.confirmation_keyboard(True) is keyboards.confirmation_keyboard(True)
@@ -0,0 +1,123 @@
+"""Нагрузочная проверка сохранения проектов с проверкой ревизии."""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src import storage
+from src.handlers import projects
+
+EVENT_ID = "stress"
+EDITS_PER_EDITOR = 50
+
+
+def _increment(event_id: str) -> int:
+    """Одна правка «загрузил → изменил → сохранил» с повтором при конфликте."""
+    conflicts = 0
+    while True:
+        project = storage.load_project(event_id)
+        project["counter"] += 1
+        project.setdefault("editors", []).append(threading.get_ident())
+        try:
+            storage.update_project(project)
+            return conflicts
+        except storage.RevisionConflict:
+            conflicts += 1
+
+
+def _editor(event_id: str, edits: int) -> int:
+    return sum(_increment(event_id) for _ in range(edits))
+
+
+def _process_editor(data_dir: str, event_id: str, edits: int) -> int:
+    storage.set_data_dir(Path(data_dir))
+    return _editor(event_id, edits)
+
+
+def _report(label: str, editors: int, elapsed: float, conflicts: int) -> None:
+    total = editors * EDITS_PER_EDITOR
+    print(
+        f"\n{label}: {editors} редакторов, {total} правок за {elapsed:.2f} с "
+        f"({total / elapsed:.0f} правок/с), конфликтов: {conflicts}"
+    )
+
+
+def _assert_no_lost_updates(editors: int) -> None:
+    project = storage.load_project(EVENT_ID)
+    total = editors * EDITS_PER_EDITOR
+    assert project["counter"] == total
+    assert len(project["editors"]) == total
+    assert project["revision"] == total + 1
+
+
+@pytest.mark.parametrize("editors", [2, 8, 16])
+def test_threads_do_not_lose_updates(data_dir: Path, editors: int) -> None:
+    storage.save_project({"event_id": EVENT_ID, "counter": 0})
+    conflicts = []
+
+    def run() -> None:
+        conflicts.append(_editor(EVENT_ID, EDITS_PER_EDITOR))
+
+    threads = [threading.Thread(target=run) for _ in range(editors)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _report("Потоки", editors, time.perf_counter() - started, sum(conflicts))
+    _assert_no_lost_updates(editors)
+
+
+@pytest.mark.parametrize("editors", [2, 4])
+def test_processes_do_not_lose_updates(data_dir: Path, editors: int) -> None:
+    storage.save_project({"event_id": EVENT_ID, "counter": 0})
+    ctx = multiprocessing.get_context("spawn")
+    started = time.perf_counter()
+    with ctx.Pool(editors) as pool:
+        conflicts = pool.starmap(
+            _process_editor, [(str(data_dir), EVENT_ID, EDITS_PER_EDITOR)] * editors
+        )
+    _report("Процессы", editors, time.perf_counter() - started, sum(conflicts))
+    _assert_no_lost_updates(editors)
+
+
+def test_stale_revision_is_rejected(data_dir: Path) -> None:
+    storage.save_project({"event_id": EVENT_ID, "counter": 0})
+    first = storage.load_project(EVENT_ID)
+    second = storage.load_project(EVENT_ID)
+    storage.update_project(first)
+    with pytest.raises(storage.RevisionConflict):
+        storage.update_project(second)
+
+
+def test_edit_project_reapplies_change_after_conflict(
+    data_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage.save_project({"event_id": EVENT_ID, "counter": 0})
+    monkeypatch.setattr(projects, "RETRY_BASE_DELAY", 0)
+    original_update = storage.update_project
+    calls = []
+
+    def update_with_rival(project: dict) -> None:
+        # Перед первой записью проект успевает сохранить «другой процесс»
+        if not calls:
+            rival = storage.load_project(EVENT_ID)
+            rival["counter"] += 10
+            original_update(rival)
+        calls.append(project["revision"])
+        original_update(project)
+
+    monkeypatch.setattr(storage, "update_project", update_with_rival)
+
+    def mutate(project: dict) -> tuple:
+        project["counter"] += 1
+        return project["counter"], True
+
+    _, result = asyncio.run(projects._edit_project(EVENT_ID, mutate))
+    assert result == 11
+    assert len(calls) == 2
+    assert storage.load_project(EVENT_ID)["counter"] == 11
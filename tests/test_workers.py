@@ -0,0 +1,70 @@
+"""Тесты маршрутизации многопроцессного режима."""
+
+import asyncio
+from typing import Optional
+
+import pytest
+from telegram import Update
+
+from src import workers
+
+
+def _update(chat_id: int, text: str, update_id: int = 1) -> Update:
+    return Update.de_json(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": chat_id, "type": "private"},
+                "text": text,
+            },
+        },
+        None,
+    )
+
+
+@pytest.fixture
+def pool() -> workers.WorkerPool:
+    return workers.WorkerPool("token", 4, lambda token: None)
+
+
+@pytest.mark.parametrize("chat_id", [5, -1001234567, 42])
+def test_chat_always_goes_to_same_worker(pool: workers.WorkerPool, chat_id: int) -> None:
+    indexes = {pool.route(_update(chat_id, f"сообщение {n}")) for n in range(10)}
+    assert indexes == {workers.worker_index(chat_id, 4)}
+
+
+def test_update_without_chat_goes_to_first_worker() -> None:
+    assert workers.worker_index(None, 4) == 0
+
+
+@pytest.mark.parametrize(
+    "text, expected_chat",
+    [
+        ("/profile 20 chat=7", 7),
+        ("/profile@eventpilot_bot 20 state=project_edit chat=6", 6),
+        ("/profile 20", 1),
+    ],
+)
+def test_profile_goes_to_worker_of_target_chat(
+    pool: workers.WorkerPool, text: str, expected_chat: Optional[int]
+) -> None:
+    assert pool.route(_update(1, text)) == workers.worker_index(expected_chat, 4)
+
+
+def test_profile_stop_goes_to_profiled_worker(pool: workers.WorkerPool) -> None:
+    pool.route(_update(1, "/profile 20 chat=7"))
+    assert pool.route(_update(1, "/profile stop")) == workers.worker_index(7, 4)
+
+
+def test_full_queue_drops_update_instead_of_blocking(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(workers, "QUEUE_MAX_SIZE", 1)
+    monkeypatch.setattr(workers, "QUEUE_PUT_TIMEOUT", 0.01)
+    pool = workers.WorkerPool("token", 1, lambda token: None)
+    monkeypatch.setattr(pool, "ensure_alive", lambda index: None)
+
+    asyncio.run(pool.dispatch(_update(1, "первое", update_id=1)))
+    asyncio.run(pool.dispatch(_update(1, "второе", update_id=2)))
+    assert pool.queues[0].get(timeout=1)["update_id"] == 1
+    assert pool.queues[0].empty()